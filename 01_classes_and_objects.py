@@ -24,6 +24,11 @@ class Car:
     - Constructor (__init__ method)
     """
     
+    # __slots__ lists every attribute the object will ever have. Python then
+    # stores them in a fixed layout instead of a per-object __dict__, which
+    # saves memory and makes attribute access slightly faster.
+    __slots__ = ("make", "model", "year", "color", "is_running", "speed", "mileage")
+    
     def __init__(self, make, model, year, color="Unknown"):
         """
         Constructor method to initialize a Car object.
@@ -101,7 +106,8 @@ class Car:
             str: Message about the current speed
         """
         if self.speed > 0:
-            self.speed = max(0, self.speed - speed_decrease)  # Don't go below 0
+            new_speed = self.speed - speed_decrease
+            self.speed = new_speed if new_speed > 0 else 0  # Don't go below 0
             return f"Braking! Current speed: {self.speed} mph"
         else:
             return "Car is already stopped."
@@ -14,6 +14,30 @@ Author: AI Senior Engineer
 """
 
 
+def _reject_unused_kwargs(obj, cls, kwargs):
+    """
+    Report keyword arguments that no class left in the MRO will accept.
+    
+    Without this check, an unknown keyword travels all the way to
+    object.__init__(), whose error message ("takes exactly one argument")
+    does not say which argument was wrong.
+    
+    Args:
+        obj (object): The instance being initialized
+        cls (type): The class whose __init__ is about to call super().__init__()
+        kwargs (dict): Keyword arguments it would forward
+    
+    Raises:
+        TypeError: If kwargs is not empty and object is next in the MRO
+    """
+    if kwargs:
+        mro = type(obj).__mro__
+        if mro[mro.index(cls) + 1] is object:
+            name = next(iter(kwargs))
+            raise TypeError(f"{type(obj).__name__}.__init__() got an unexpected "
+                            f"keyword argument '{name}'")
+
+
 class Vehicle:
     """
     Base class representing a general vehicle.
@@ -25,7 +49,14 @@ class Vehicle:
     - Constructor with default values
     """
     
-    def __init__(self, make, model, year, fuel_type="Gasoline"):
+    # Each class in the hierarchy lists only the attributes it introduces;
+    # subclasses inherit the parent's slots automatically.
+    __slots__ = ("make", "model", "year", "fuel_type", "is_running", "speed", "mileage")
+    
+    # Title line used by get_info(); subclasses override this class attribute
+    _INFO_TITLE = "Vehicle Info:"
+    
+    def __init__(self, make, model, year, fuel_type="Gasoline", **kwargs):
         """
         Initialize a Vehicle object.
         
@@ -34,6 +65,8 @@ class Vehicle:
             model (str): Vehicle model
             year (int): Manufacturing year
             fuel_type (str, optional): Type of fuel. Defaults to "Gasoline"
+            **kwargs: Passed on to the next class in the MRO (used by
+                mixins such as ElectricVehicle)
         """
         self.make = make
         self.model = model
@@ -42,6 +75,24 @@ class Vehicle:
         self.is_running = False
         self.speed = 0
         self.mileage = 0
+        
+        # Cooperative inheritance: let the next class in the MRO initialize
+        # its own attributes (for plain vehicles this is just object)
+        _reject_unused_kwargs(self, Vehicle, kwargs)
+        super().__init__(**kwargs)
+    
+    @property
+    def label(self):
+        """
+        Display name of the vehicle, e.g. "2023 Toyota Camry".
+        
+        The name is built from make, model and year on every read, so it
+        stays correct if those attributes are changed.
+        
+        Returns:
+            str: "{year} {make} {model}"
+        """
+        return f"{self.year} {self.make} {self.model}"
     
     def start_engine(self):
         """
@@ -52,7 +103,7 @@ class Vehicle:
         """
         if not self.is_running:
             self.is_running = True
-            return f"The {self.year} {self.make} {self.model} engine is now running!"
+            return f"The {self.label} engine is now running!"
         return f"The {self.make} {self.model} engine is already running."
     
     def stop_engine(self):
@@ -65,7 +116,7 @@ class Vehicle:
         if self.is_running:
             self.is_running = False
             self.speed = 0
-            return f"The {self.year} {self.make} {self.model} engine is now stopped."
+            return f"The {self.label} engine is now stopped."
         return f"The {self.make} {self.model} engine is already stopped."
     
     def accelerate(self, speed_increase):
@@ -83,22 +134,39 @@ class Vehicle:
             return f"Accelerating! Current speed: {self.speed} mph"
         return "Cannot accelerate. Engine is not running!"
     
+    def _info_extra(self):
+        """
+        Extra detail lines used by get_info(). Subclasses override this.
+        
+        Returns:
+            str: Additional lines, or an empty string if there are none
+        """
+        return ""
+    
     def get_info(self):
         """
         Get vehicle information.
         
+        This is a "template method": the overall layout is defined once here,
+        and subclasses customize it by overriding _INFO_TITLE and
+        _info_extra() instead of re-implementing get_info().
+        
         Returns:
             str: Formatted vehicle details
         """
         status = "Running" if self.is_running else "Stopped"
-        return (f"Vehicle Info:\n"
+        extra = self._info_extra()
+        separator = "\n" if extra else ""
+        # One f-string builds the whole block in a single pass
+        return (f"{self._INFO_TITLE}\n"
                 f"  Make: {self.make}\n"
                 f"  Model: {self.model}\n"
                 f"  Year: {self.year}\n"
                 f"  Fuel Type: {self.fuel_type}\n"
                 f"  Status: {status}\n"
                 f"  Speed: {self.speed} mph\n"
-                f"  Mileage: {self.mileage} miles")
+                f"  Mileage: {self.mileage} miles"
+                f"{separator}{extra}")
 
 
 class Car(Vehicle):
@@ -112,7 +180,12 @@ class Car(Vehicle):
     - Using super() to call parent methods
     """
     
-    def __init__(self, make, model, year, fuel_type="Gasoline", doors=4, transmission="Automatic"):
+    __slots__ = ("doors", "transmission", "trunk_open", "air_conditioning")
+    
+    _INFO_TITLE = "Car Info:"
+    
+    def __init__(self, make, model, year, fuel_type="Gasoline", doors=4, transmission="Automatic",
+                 **kwargs):
         """
         Initialize a Car object.
         
@@ -123,9 +196,10 @@ class Car(Vehicle):
             fuel_type (str, optional): Type of fuel. Defaults to "Gasoline"
             doors (int, optional): Number of doors. Defaults to 4
             transmission (str, optional): Transmission type. Defaults to "Automatic"
+            **kwargs: Passed on to the next class in the MRO
         """
         # Call parent class constructor using super()
-        super().__init__(make, model, year, fuel_type)
+        super().__init__(make, model, year, fuel_type, **kwargs)
         
         # Add car-specific attributes
         self.doors = doors
@@ -170,27 +244,20 @@ class Car(Vehicle):
             return f"Air conditioning is now {status}."
         return "Cannot control AC. Engine is not running!"
     
-    def get_info(self):
+    def _info_extra(self):
         """
-        Override parent's get_info method to include car-specific details.
+        Override to add car-specific details to get_info().
         
         Returns:
-            str: Formatted car details
+            str: Car-specific detail lines
         """
-        # Get base info from parent class
-        base_info = super().get_info()
-        
-        # Add car-specific information
         trunk_status = "Open" if self.trunk_open else "Closed"
         ac_status = "On" if self.air_conditioning else "Off"
         
-        car_specific_info = (f"  Doors: {self.doors}\n"
-                           f"  Transmission: {self.transmission}\n"
-                           f"  Trunk: {trunk_status}\n"
-                           f"  AC: {ac_status}")
-        
-        # Replace "Vehicle Info:" with "Car Info:" and add car-specific details
-        return base_info.replace("Vehicle Info:", "Car Info:") + "\n" + car_specific_info
+        return (f"  Doors: {self.doors}\n"
+                f"  Transmission: {self.transmission}\n"
+                f"  Trunk: {trunk_status}\n"
+                f"  AC: {ac_status}")
 
 
 class Motorcycle(Vehicle):
@@ -203,6 +270,10 @@ class Motorcycle(Vehicle):
     - Method overriding with different behavior
     """
     
+    __slots__ = ("engine_size", "has_sidecar", "helmet_count")
+    
+    _INFO_TITLE = "Motorcycle Info:"
+    
     def __init__(self, make, model, year, fuel_type="Gasoline", engine_size=600, has_sidecar=False):
         """
         Initialize a Motorcycle object.
@@ -260,26 +331,23 @@ class Motorcycle(Vehicle):
                 return "Safety first! Put on a helmet before riding!"
             
             # Motorcycles accelerate 1.5x faster than regular vehicles
-            actual_increase = int(speed_increase * 1.5)
-            self.speed += actual_increase
-            return f"Vrooom! Rapid acceleration! Current speed: {self.speed} mph"
+            new_speed = self.speed + int(speed_increase * 1.5)
+            self.speed = new_speed
+            return f"Vrooom! Rapid acceleration! Current speed: {new_speed} mph"
         return "Cannot accelerate. Engine is not running!"
     
-    def get_info(self):
+    def _info_extra(self):
         """
-        Override parent's get_info method for motorcycle-specific details.
+        Override to add motorcycle-specific details to get_info().
         
         Returns:
-            str: Formatted motorcycle details
+            str: Motorcycle-specific detail lines
         """
-        base_info = super().get_info()
         sidecar_status = "Yes" if self.has_sidecar else "No"
         
-        motorcycle_info = (f"  Engine Size: {self.engine_size}cc\n"
-                         f"  Has Sidecar: {sidecar_status}\n"
-                         f"  Helmets Worn: {self.helmet_count}")
-        
-        return base_info.replace("Vehicle Info:", "Motorcycle Info:") + "\n" + motorcycle_info
+        return (f"  Engine Size: {self.engine_size}cc\n"
+                f"  Has Sidecar: {sidecar_status}\n"
+                f"  Helmets Worn: {self.helmet_count}")
 
 
 class ElectricVehicle:
@@ -290,20 +358,29 @@ class ElectricVehicle:
     - Mixin pattern (class designed to be inherited with other classes)
     - Adding specific functionality that can be combined with other classes
     - Multiple inheritance preparation
+    
+    Note:
+        The mixin does not declare __slots__, so it keeps a regular instance
+        __dict__ and works on its own as well as in combination. (Two bases
+        with non-empty __slots__ could not be combined: Python raises
+        "multiple bases have instance lay-out conflict".)
     """
     
-    def __init__(self, battery_capacity=100, charging_speed="Standard"):
+    def __init__(self, battery_capacity=100, charging_speed="Standard", **kwargs):
         """
         Initialize electric vehicle components.
         
         Args:
             battery_capacity (int, optional): Battery capacity in kWh. Defaults to 100
             charging_speed (str, optional): Charging speed type. Defaults to "Standard"
+            **kwargs: Passed on to the next class in the MRO
         """
         self.battery_capacity = battery_capacity
         self.battery_level = 100  # Start with full battery
         self.charging_speed = charging_speed
         self.is_charging = False
+        _reject_unused_kwargs(self, ElectricVehicle, kwargs)
+        super().__init__(**kwargs)
     
     def start_charging(self):
         """
@@ -341,10 +418,10 @@ class ElectricVehicle:
         Returns:
             bool: True if enough battery, False otherwise
         """
-        if self.battery_level >= amount:
-            self.battery_level -= amount
-            return True
-        return False
+        level = self.battery_level
+        sufficient = level >= amount
+        self.battery_level = level - amount if sufficient else level
+        return sufficient
     
     def get_electric_info(self):
         """
@@ -371,6 +448,13 @@ class ElectricCar(Car, ElectricVehicle):
     - Diamond problem resolution
     """
     
+    # Slot storage for the ElectricVehicle mixin attributes plus our own; the mixin
+    # itself is unslotted, so ElectricCar instances also carry a __dict__
+    __slots__ = ("battery_capacity", "battery_level", "charging_speed", "is_charging",
+                 "regenerative_braking", "eco_mode")
+    
+    _INFO_TITLE = "Electric Car Info:"
+    
     def __init__(self, make, model, year, doors=4, transmission="Automatic", 
                  battery_capacity=100, charging_speed="Fast"):
         """
@@ -385,11 +469,12 @@ class ElectricCar(Car, ElectricVehicle):
             battery_capacity (int, optional): Battery capacity in kWh. Defaults to 100
             charging_speed (str, optional): Charging speed type. Defaults to "Fast"
         """
-        # Initialize Car with electric fuel type
-        Car.__init__(self, make, model, year, "Electric", doors, transmission)
-        
-        # Initialize ElectricVehicle
-        ElectricVehicle.__init__(self, battery_capacity, charging_speed)
+        # One cooperative super() call initializes every parent exactly once,
+        # following the MRO: Car -> Vehicle -> ElectricVehicle -> object.
+        # Each class takes the arguments it knows and forwards the rest.
+        super().__init__(make, model, year, "Electric", doors, transmission,
+                         battery_capacity=battery_capacity,
+                         charging_speed=charging_speed)
         
         # Electric car specific attributes
         self.regenerative_braking = True
@@ -426,10 +511,11 @@ class ElectricCar(Car, ElectricVehicle):
         
         # Apply eco mode effects
         if self.eco_mode:
-            speed_increase = int(speed_increase * 0.8)  # Reduce acceleration in eco mode
+            speed_increase = int(speed_increase * 0.8)  # 80% acceleration in eco mode
         
-        self.speed += speed_increase
-        return f"Silent acceleration! Current speed: {self.speed} mph (Battery: {self.battery_level}%)"
+        new_speed = self.speed + speed_increase
+        self.speed = new_speed
+        return f"Silent acceleration! Current speed: {new_speed} mph (Battery: {self.battery_level}%)"
     
     def brake(self, speed_decrease):
         """
@@ -442,7 +528,8 @@ class ElectricCar(Car, ElectricVehicle):
             str: Braking status message
         """
         if self.speed > 0:
-            self.speed = max(0, self.speed - speed_decrease)
+            new_speed = self.speed - speed_decrease
+            self.speed = new_speed if new_speed > 0 else 0
             
             # Regenerative braking recovers some battery
             if self.regenerative_braking and self.battery_level < 100:
@@ -454,28 +541,21 @@ class ElectricCar(Car, ElectricVehicle):
             return f"Braking! Current speed: {self.speed} mph"
         return "Car is already stopped."
     
-    def get_info(self):
+    def _info_extra(self):
         """
-        Override get_info to include electric car details.
+        Extend Car's details with electric vehicle details.
         
         Returns:
-            str: Formatted electric car details
+            str: Car, electric vehicle and electric car detail lines
         """
-        # Get car info
-        car_info = super().get_info()
-        
-        # Get electric vehicle info
-        electric_info = self.get_electric_info()
-        
-        # Add electric car specific info
         eco_status = "Enabled" if self.eco_mode else "Disabled"
         regen_status = "Enabled" if self.regenerative_braking else "Disabled"
         
-        electric_car_info = (f"  Eco Mode: {eco_status}\n"
-                           f"  Regenerative Braking: {regen_status}")
-        
-        return (car_info.replace("Car Info:", "Electric Car Info:") + 
-                "\n" + electric_info + "\n" + electric_car_info)
+        # super() finds Car._info_extra (next in MRO) for the car details
+        return (f"{super()._info_extra()}\n"
+                f"{self.get_electric_info()}\n"
+                f"  Eco Mode: {eco_status}\n"
+                f"  Regenerative Braking: {regen_status}")
 
 
 def demonstrate_inheritance():
@@ -542,14 +622,14 @@ def demonstrate_inheritance():
     print("\n4. TYPE CHECKING:")
     print("-" * 20)
     
-    vehicles = [regular_car, motorcycle, electric_car]
+    vehicles = (regular_car, motorcycle, electric_car)
+    vehicle_names = ("Regular Car", "Motorcycle", "Electric Car")
+    checked_types = (Vehicle, Car, ElectricVehicle)
     
-    for i, vehicle in enumerate(vehicles, 1):
-        vehicle_name = ["Regular Car", "Motorcycle", "Electric Car"][i-1]
+    for vehicle_name, vehicle in zip(vehicle_names, vehicles):
         print(f"\n{vehicle_name} type checks:")
-        print(f"  isinstance(Vehicle): {isinstance(vehicle, Vehicle)}")
-        print(f"  isinstance(Car): {isinstance(vehicle, Car)}")
-        print(f"  isinstance(ElectricVehicle): {isinstance(vehicle, ElectricVehicle)}")
+        for cls in checked_types:
+            print(f"  isinstance({cls.__name__}): {isinstance(vehicle, cls)}")
     
     print("\nClass hierarchy checks:")
     print(f"Car is subclass of Vehicle: {issubclass(Car, Vehicle)}")
@@ -569,27 +649,33 @@ def demonstrate_inheritance():
     print("-" * 30)
     
     print("When ElectricCar.get_info() is called:")
-    print("1. ElectricCar.get_info() calls super().get_info()")
-    print("2. This calls Car.get_info() (next in MRO)")
-    print("3. Car.get_info() calls super().get_info()")
-    print("4. This calls Vehicle.get_info() (next in MRO)")
-    print("5. ElectricCar adds its own information")
+    print("1. Vehicle.get_info() runs (the only get_info in the MRO)")
+    print("2. It reads self._INFO_TITLE -> ElectricCar's value")
+    print("3. It calls self._info_extra() -> ElectricCar's version")
+    print("4. ElectricCar._info_extra() calls super()._info_extra()")
+    print("5. This calls Car._info_extra() (next in MRO)")
+    print("6. ElectricCar adds its own information")
     
     # Polymorphism demonstration
     print("\n7. POLYMORPHISM IN ACTION:")
     print("-" * 35)
     
-    all_vehicles = [regular_car, motorcycle, electric_car]
-    
     print("Accelerating all vehicles by 10 mph:")
-    for i, vehicle in enumerate(all_vehicles):
-        vehicle_names = ["Regular Car", "Motorcycle", "Electric Car"]
-        print(f"{vehicle_names[i]}: {vehicle.accelerate(10)}")
+    for vehicle_name, vehicle in zip(vehicle_names, vehicles):
+        print(f"{vehicle_name}: {vehicle.accelerate(10)}")
 
 
 if __name__ == "__main__":
     """
     Main execution block.
+    
+    The lesson is pure Python with no third-party dependencies, so it also
+    runs unchanged under PyPy (a Python implementation with a JIT compiler):
+    
+        pypy3 02_inheritance.py
+    
+    The classes keep a fixed set of attributes after __init__ (__slots__)
+    and define no __getattr__, which is what a JIT specializes best.
     """
     demonstrate_inheritance()
 
@@ -13,6 +13,55 @@ This lesson covers encapsulation concepts in OOP:
 Author: AI Senior Engineer
 """
 
+import hashlib
+import hmac
+import io
+import os
+import re
+import sys
+from collections import deque
+from contextlib import redirect_stdout
+from itertools import count, islice
+
+# A valid PIN is exactly four digits. Compiling the pattern once lets every
+# check reuse it instead of running several separate string tests.
+_PIN_PATTERN = re.compile(r"\d{4}")
+
+# Simple email check: something@something.something, without spaces
+_EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Transaction types recorded in the account history
+_TXN_PIN_SET = "PIN_SET"
+_TXN_DEPOSIT = "DEPOSIT"
+_TXN_WITHDRAWAL = "WITHDRAWAL"
+_TXN_LOCK = "LOCK"
+
+
+class _Transaction:
+    """
+    A single entry in a BankAccount's transaction history.
+    
+    A small record class with __slots__ takes less memory than a dict with
+    the same four keys, and its fields are read as plain attributes.
+    """
+    
+    __slots__ = ("type", "amount", "description", "timestamp")
+    
+    def __init__(self, transaction_type, amount, description, timestamp):
+        """
+        Initialize a transaction record.
+        
+        Args:
+            transaction_type (str): Type of transaction
+            amount (float): Transaction amount
+            description (str): Transaction description
+            timestamp (str): When the transaction happened
+        """
+        self.type = transaction_type
+        self.amount = amount
+        self.description = description
+        self.timestamp = timestamp
+
 
 class BankAccount:
     """
@@ -25,8 +74,17 @@ class BankAccount:
     - Controlled access to sensitive data
     """
     
-    # Class variable for generating account numbers
-    _next_account_number = 1000
+    # Private names in __slots__ are name-mangled just like private
+    # attributes, e.g. "__balance" becomes "_BankAccount__balance"
+    __slots__ = ("owner_name", "account_creation_date", "_account_number",
+                 "__balance", "__pin", "__pin_salt", "__is_locked", "__transaction_history")
+    
+    # Class variable for generating account numbers: 1000, 1001, 1002, ...
+    # next() on a count is a single step, so no read-modify-write is needed
+    _account_numbers = count(1000)
+    
+    # Only the most recent transactions are kept; older ones are dropped
+    _HISTORY_LIMIT = 1000
     
     def __init__(self, owner_name, initial_balance=0):
         """
@@ -48,15 +106,15 @@ class BankAccount:
         
         # Protected attributes (convention: single underscore prefix)
         # Should not be accessed directly from outside, but can be in subclasses
-        self._account_number = BankAccount._next_account_number
-        BankAccount._next_account_number += 1
+        self._account_number = next(BankAccount._account_numbers)
         
         # Private attributes (double underscore prefix - name mangling)
         # Cannot be accessed directly from outside the class
         self.__balance = initial_balance
-        self.__pin = None
+        self.__pin = None        # Salted hash of the PIN, never the PIN itself
+        self.__pin_salt = None
         self.__is_locked = False
-        self.__transaction_history = []
+        self.__transaction_history = deque(maxlen=self._HISTORY_LIMIT)
     
     def set_pin(self, new_pin):
         """
@@ -71,11 +129,13 @@ class BankAccount:
         if self.__is_locked:
             return "Account is locked. Cannot change PIN."
         
-        if not isinstance(new_pin, str) or len(new_pin) != 4 or not new_pin.isdigit():
+        if not isinstance(new_pin, str) or not _PIN_PATTERN.fullmatch(new_pin):
             return "PIN must be a 4-digit string."
         
-        self.__pin = new_pin
-        self.__add_transaction("PIN_SET", 0, "PIN has been set")
+        # Store only a salted hash so the PIN itself is never kept in memory
+        self.__pin_salt = os.urandom(16)
+        self.__pin = self.__hash_pin(new_pin, self.__pin_salt)
+        self.__add_transaction(_TXN_PIN_SET, 0, "PIN has been set")
         return "PIN set successfully."
     
     def verify_pin(self, entered_pin):
@@ -88,9 +148,46 @@ class BankAccount:
         Returns:
             bool: True if PIN is correct, False otherwise
         """
-        if self.__pin is None:
+        if self.__pin is None or not isinstance(entered_pin, str):
             return False
-        return self.__pin == entered_pin
+        # compare_digest takes the same time whether or not the hashes match,
+        # so timing does not reveal how much of the PIN was right
+        return hmac.compare_digest(self.__pin, self.__hash_pin(entered_pin, self.__pin_salt))
+    
+    @staticmethod
+    def __hash_pin(pin, salt):
+        """
+        Hash a PIN with the account's salt (private helper).
+        
+        Args:
+            pin (str): PIN to hash
+            salt (bytes): Random per-account salt
+        
+        Returns:
+            bytes: The PIN hash
+        """
+        return hashlib.blake2b(pin.encode(), key=salt, digest_size=16).digest()
+    
+    def _check_access(self, pin, require_pin=True,
+                      invalid_pin_message="Invalid PIN. Access denied."):
+        """
+        Run the lock and PIN checks shared by the account operations.
+        
+        Args:
+            pin (str): PIN for verification
+            require_pin (bool, optional): Whether the PIN must be valid. Defaults to True
+            invalid_pin_message (str, optional): Message returned for a wrong PIN
+        
+        Returns:
+            str or None: Error message, or None if access is allowed
+        """
+        if self.__is_locked:
+            return "Account is locked. Please contact customer service."
+        
+        if require_pin and not self.verify_pin(pin):
+            return invalid_pin_message
+        
+        return None
     
     def deposit(self, amount, pin=None):
         """
@@ -103,8 +200,9 @@ class BankAccount:
         Returns:
             str: Transaction result message
         """
-        if self.__is_locked:
-            return "Account is locked. Please contact customer service."
+        error = self._check_access(pin, require_pin=False)
+        if error:
+            return error
         
         if amount <= 0:
             return "Deposit amount must be positive."
@@ -113,9 +211,10 @@ class BankAccount:
         if amount > 10000 and not self.verify_pin(pin):
             return "PIN required for deposits over $10,000."
         
-        self.__balance += amount
-        self.__add_transaction("DEPOSIT", amount, f"Deposited ${amount:.2f}")
-        return f"Successfully deposited ${amount:.2f}. New balance: ${self.__balance:.2f}"
+        balance = self.__balance + amount
+        self.__balance = balance
+        self.__add_transaction(_TXN_DEPOSIT, amount, f"Deposited ${amount:.2f}")
+        return f"Successfully deposited ${amount:.2f}. New balance: ${balance:.2f}"
     
     def withdraw(self, amount, pin):
         """
@@ -128,21 +227,21 @@ class BankAccount:
         Returns:
             str: Transaction result message
         """
-        if self.__is_locked:
-            return "Account is locked. Please contact customer service."
-        
-        if not self.verify_pin(pin):
-            return "Invalid PIN. Withdrawal denied."
+        error = self._check_access(pin, invalid_pin_message="Invalid PIN. Withdrawal denied.")
+        if error:
+            return error
         
         if amount <= 0:
             return "Withdrawal amount must be positive."
         
-        if amount > self.__balance:
-            return f"Insufficient funds. Available balance: ${self.__balance:.2f}"
+        balance = self.__balance
+        if amount > balance:
+            return f"Insufficient funds. Available balance: ${balance:.2f}"
         
-        self.__balance -= amount
-        self.__add_transaction("WITHDRAWAL", -amount, f"Withdrew ${amount:.2f}")
-        return f"Successfully withdrew ${amount:.2f}. New balance: ${self.__balance:.2f}"
+        balance -= amount
+        self.__balance = balance
+        self.__add_transaction(_TXN_WITHDRAWAL, -amount, f"Withdrew ${amount:.2f}")
+        return f"Successfully withdrew ${amount:.2f}. New balance: ${balance:.2f}"
     
     def get_balance(self, pin):
         """
@@ -154,11 +253,9 @@ class BankAccount:
         Returns:
             str: Balance information or error message
         """
-        if self.__is_locked:
-            return "Account is locked. Please contact customer service."
-        
-        if not self.verify_pin(pin):
-            return "Invalid PIN. Access denied."
+        error = self._check_access(pin)
+        if error:
+            return error
         
         return f"Current balance: ${self.__balance:.2f}"
     
@@ -170,7 +267,7 @@ class BankAccount:
             str: Lock status message
         """
         self.__is_locked = True
-        self.__add_transaction("LOCK", 0, "Account has been locked")
+        self.__add_transaction(_TXN_LOCK, 0, "Account has been locked")
         return "Account has been locked for security."
     
     def __add_transaction(self, transaction_type, amount, description):
@@ -186,39 +283,52 @@ class BankAccount:
             This is a private method (double underscore prefix)
             Cannot be called directly from outside the class
         """
-        transaction = {
-            "type": transaction_type,
-            "amount": amount,
-            "description": description,
-            "timestamp": "2024-01-01 12:00:00"  # Simplified for demo
-        }
+        transaction = _Transaction(transaction_type, amount, description,
+                                   "2024-01-01 12:00:00")  # Simplified for demo
         self.__transaction_history.append(transaction)
     
-    def get_transaction_history(self, pin):
+    def get_transaction_history(self, pin, offset=0, limit=10):
         """
         Get transaction history (requires PIN).
         
+        The history is shown one page at a time, oldest first within the page.
+        
         Args:
             pin (str): PIN for verification
+            offset (int, optional): Number of most recent transactions to skip. Defaults to 0
+            limit (int, optional): Maximum transactions on the page. Defaults to 10
         
         Returns:
             str: Transaction history or error message
         """
-        if self.__is_locked:
-            return "Account is locked. Please contact customer service."
-        
-        if not self.verify_pin(pin):
-            return "Invalid PIN. Access denied."
+        error = self._check_access(pin)
+        if error:
+            return error
         
         if not self.__transaction_history:
             return "No transactions found."
         
-        history = "Transaction History:\n"
-        for i, transaction in enumerate(self.__transaction_history[-10:], 1):  # Last 10 transactions
-            history += (f"{i}. {transaction['timestamp']} - {transaction['type']}: "
-                       f"{transaction['description']}\n")
+        # Join the lines once instead of growing a string with += in a loop
+        return "Transaction History:\n" + "".join(self.__history_lines(offset, limit))
+    
+    def __history_lines(self, offset, limit):
+        """
+        Yield formatted lines for one page of the transaction history.
         
-        return history
+        Args:
+            offset (int): Number of most recent transactions to skip
+            limit (int): Maximum number of transactions to yield
+        
+        Yields:
+            str: One formatted transaction line (ending with a newline)
+        """
+        # Walk back from the newest entry, then restore chronological order
+        page = list(islice(reversed(self.__transaction_history), offset, offset + limit))
+        page.reverse()
+        
+        for i, transaction in enumerate(page, 1):
+            yield (f"{i}. {transaction.timestamp} - {transaction.type}: "
+                   f"{transaction.description}\n")
     
     # Protected method (single underscore - convention only)
     def _get_account_number(self):
@@ -257,6 +367,8 @@ class SecureBankAccount(BankAccount):
     - Overriding methods while maintaining encapsulation
     """
     
+    __slots__ = ("__security_question", "__security_answer", "__failed_attempts", "__max_attempts")
+    
     def __init__(self, owner_name, initial_balance=0, security_question=None, security_answer=None):
         """
         Initialize a SecureBankAccount object.
@@ -271,10 +383,24 @@ class SecureBankAccount(BankAccount):
         
         # Additional private attributes for enhanced security
         self.__security_question = security_question
-        self.__security_answer = security_answer.lower() if security_answer else None
+        # Only a hash of the answer is kept, never the answer itself
+        self.__security_answer = self.__hash_answer(security_answer) if security_answer else None
         self.__failed_attempts = 0
         self.__max_attempts = 3
     
+    @staticmethod
+    def __hash_answer(answer):
+        """
+        Hash a security answer, ignoring upper/lower case (private helper).
+        
+        Args:
+            answer (str): Security answer
+        
+        Returns:
+            bytes: The answer hash
+        """
+        return hashlib.blake2b(answer.lower().encode(), digest_size=16).digest()
+    
     def set_security_question(self, question, answer, pin):
         """
         Set security question and answer.
@@ -294,7 +420,7 @@ class SecureBankAccount(BankAccount):
             return "Both question and answer are required."
         
         self.__security_question = question
-        self.__security_answer = answer.lower()
+        self.__security_answer = self.__hash_answer(answer)
         return "Security question set successfully."
     
     def reset_pin_with_security(self, new_pin, security_answer):
@@ -315,7 +441,7 @@ class SecureBankAccount(BankAccount):
         if not self.__security_question or not self.__security_answer:
             return "No security question set for this account."
         
-        if security_answer.lower() != self.__security_answer:
+        if not hmac.compare_digest(self.__hash_answer(security_answer), self.__security_answer):
             self.__failed_attempts += 1
             remaining = self.__max_attempts - self.__failed_attempts
             return f"Incorrect security answer. {remaining} attempts remaining."
@@ -324,7 +450,7 @@ class SecureBankAccount(BankAccount):
         self.__failed_attempts = 0
         
         # Validate new PIN
-        if not isinstance(new_pin, str) or len(new_pin) != 4 or not new_pin.isdigit():
+        if not isinstance(new_pin, str) or not _PIN_PATTERN.fullmatch(new_pin):
             return "PIN must be a 4-digit string."
         
         # Access the private PIN attribute from parent class (through public method)
@@ -357,6 +483,8 @@ class PropertyDemo:
     - Computed properties
     """
     
+    __slots__ = ("_name", "_age", "_email", "_generated_email")
+    
     def __init__(self, name, age):
         """
         Initialize PropertyDemo object.
@@ -368,6 +496,7 @@ class PropertyDemo:
         self._name = name  # Protected attribute
         self._age = age    # Protected attribute
         self._email = None
+        self._generated_email = None  # Built on first use, see email getter
     
     @property
     def name(self):
@@ -395,6 +524,7 @@ class PropertyDemo:
         if not value.strip():
             raise ValueError("Name cannot be empty")
         self._name = value.strip().title()  # Capitalize properly
+        self._generated_email = None  # Generated email depends on the name
     
     @property
     def age(self):
@@ -435,8 +565,14 @@ class PropertyDemo:
         """
         if self._email:
             return self._email
-        # Generate email if not set
-        return f"{self._name.lower().replace(' ', '.')}@example.com"
+        # Generate email if not set. The result only depends on the name, so
+        # it is remembered until the name setter clears it. (A
+        # functools.cached_property would need __dict__, which __slots__ removes.)
+        generated = self._generated_email
+        if generated is None:
+            generated = f"{self._name.lower().replace(' ', '.')}@example.com"
+            self._generated_email = generated
+        return generated
     
     @email.setter
     def email(self, value):
@@ -457,7 +593,7 @@ class PropertyDemo:
             raise ValueError("Email must be a string")
         
         # Simple email validation
-        if "@" not in value or "." not in value.split("@")[1]:
+        if not _EMAIL_PATTERN.fullmatch(value):
             raise ValueError("Invalid email format")
         
         self._email = value.lower()
@@ -549,7 +685,9 @@ def demonstrate_encapsulation():
     # Name mangling demonstration
     print("\nName mangling with private attributes:")
     print("Private attributes are mangled to: _ClassName__attributename")
-    print("Available attributes:", [attr for attr in dir(account) if 'balance' in attr.lower()])
+    # vars(BankAccount) lists only the names defined on the class itself,
+    # which is cheaper than dir(), and includes the mangled slot name
+    print("Available attributes:", sorted(name for name in vars(BankAccount) if "balance" in name))
     
     # Enhanced security example
     print("\n3. ENHANCED SECURITY ACCOUNT:")
@@ -620,8 +758,19 @@ def demonstrate_encapsulation():
 if __name__ == "__main__":
     """
     Main execution block.
+    
+    The demo output is collected in memory and written to the terminal in
+    one call instead of one write per print(). Redirecting stdout (rather
+    than changing each print) keeps messages printed inside the classes,
+    such as the email deleter, in the right order. The buffer is written
+    in a finally block, so output printed before an error still appears.
     """
-    demonstrate_encapsulation()
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            demonstrate_encapsulation()
+    finally:
+        sys.stdout.write(buffer.getvalue())
 
 
 """
@@ -16,6 +16,11 @@ Author: AI Senior Engineer
 import math
 from typing import Protocol
 
+# Module-level names for the circle constants, so Circle reads a global
+# instead of looking up an attribute on the math module on every call
+_PI = math.pi
+_TAU = math.tau  # 2 * π, the ratio of a circle's circumference to its radius
+
 
 class Shape:
     """
@@ -25,14 +30,12 @@ class Shape:
     Each subclass will provide its own implementation of these methods.
     """
     
-    def __init__(self, name):
-        """
-        Initialize a Shape object.
-        
-        Args:
-            name (str): Name of the shape
-        """
-        self.name = name
+    # Subclasses add their own slots for their dimensions
+    __slots__ = ()
+    
+    # The name is the same for every instance of a class, so each subclass
+    # sets it once at class level instead of storing it on every object
+    name = "Shape"
     
     def area(self):
         """
@@ -74,9 +77,9 @@ class Shape:
         Returns:
             str: Formatted shape information
         """
-        return (f"Shape: {self.name}\n"
-                f"Area: {self.area():.2f}\n"
-                f"Perimeter: {self.perimeter():.2f}")
+        area = self.area()
+        perimeter = self.perimeter()
+        return f"Shape: {self.name}\nArea: {area:.2f}\nPerimeter: {perimeter:.2f}"
 
 
 class Rectangle(Shape):
@@ -87,6 +90,10 @@ class Rectangle(Shape):
     to provide rectangle-specific implementations.
     """
     
+    __slots__ = ("width", "height")
+    
+    name = "Rectangle"
+    
     def __init__(self, width, height):
         """
         Initialize a Rectangle object.
@@ -95,7 +102,6 @@ class Rectangle(Shape):
             width (float): Width of the rectangle
             height (float): Height of the rectangle
         """
-        super().__init__("Rectangle")
         self.width = width
         self.height = height
     
@@ -135,6 +141,10 @@ class Circle(Shape):
     of the Shape interface.
     """
     
+    __slots__ = ("radius",)
+    
+    name = "Circle"
+    
     def __init__(self, radius):
         """
         Initialize a Circle object.
@@ -142,7 +152,6 @@ class Circle(Shape):
         Args:
             radius (float): Radius of the circle
         """
-        super().__init__("Circle")
         self.radius = radius
     
     def area(self):
@@ -152,7 +161,7 @@ class Circle(Shape):
         Returns:
             float: Area (π * radius²)
         """
-        return math.pi * self.radius ** 2
+        return _PI * (self.radius * self.radius)
     
     def perimeter(self):
         """
@@ -161,7 +170,7 @@ class Circle(Shape):
         Returns:
             float: Circumference (2 * π * radius)
         """
-        return 2 * math.pi * self.radius
+        return _TAU * self.radius
     
     def describe(self):
         """
@@ -181,6 +190,10 @@ class Triangle(Shape):
     using the three sides of the triangle.
     """
     
+    __slots__ = ("side_a", "side_b", "side_c")
+    
+    name = "Triangle"
+    
     def __init__(self, side_a, side_b, side_c):
         """
         Initialize a Triangle object.
@@ -193,8 +206,6 @@ class Triangle(Shape):
         Raises:
             ValueError: If the sides don't form a valid triangle
         """
-        super().__init__("Triangle")
-        
         # Validate triangle inequality
         if (side_a + side_b <= side_c or 
             side_a + side_c <= side_b or 
@@ -212,11 +223,11 @@ class Triangle(Shape):
         Returns:
             float: Area calculated using Heron's formula
         """
-        # Semi-perimeter
-        s = self.perimeter() / 2
+        a, b, c = self.side_a, self.side_b, self.side_c
+        s = (a + b + c) / 2  # Semi-perimeter
         
         # Heron's formula: √(s(s-a)(s-b)(s-c))
-        return math.sqrt(s * (s - self.side_a) * (s - self.side_b) * (s - self.side_c))
+        return math.sqrt(s * (s - a) * (s - b) * (s - c))
     
     def perimeter(self):
         """
@@ -238,12 +249,40 @@ class Triangle(Shape):
                 f"{self.side_a}, {self.side_b}, and {self.side_c}")
 
 
+def _concat_lists(args):
+    """
+    Concatenate lists into one new list.
+    
+    Args:
+        args (tuple): Lists to concatenate
+    
+    Returns:
+        list: All elements in order
+    """
+    result = []
+    for lst in args:
+        result.extend(lst)
+    return result
+
+
+# How MathOperations.add() combines its arguments, chosen by the type of the
+# first one: (types every argument must have, function that combines them).
+# One dict lookup replaces testing each kind of input in turn.
+_ADD_DISPATCH = {
+    int: ((int, float), sum),
+    float: ((int, float), sum),
+    str: (str, "".join),
+    list: (list, _concat_lists),
+}
+
+
 class MathOperations:
     """
     Class demonstrating method overloading simulation in Python.
     
     Python doesn't have true method overloading, but we can simulate it
     using default parameters, *args, **kwargs, and type checking.
+    add() looks up how to combine its arguments in a dict keyed by type.
     """
     
     def add(self, *args):
@@ -262,20 +301,19 @@ class MathOperations:
         if not args:
             raise ValueError("At least one argument required")
         
-        # Check if all arguments are numbers
-        if all(isinstance(arg, (int, float)) for arg in args):
-            return sum(args)
-        
-        # Check if all arguments are strings
-        if all(isinstance(arg, str) for arg in args):
-            return "".join(args)
+        # Dispatch on the type of the first argument: numbers are summed,
+        # strings and lists concatenated
+        first_type = type(args[0])
+        entry = _ADD_DISPATCH.get(first_type)
+        if entry is None:
+            # Subclasses such as bool use their parent's entry
+            entry = next((_ADD_DISPATCH[cls] for cls in first_type.__mro__
+                          if cls in _ADD_DISPATCH), None)
         
-        # Check if all arguments are lists
-        if all(isinstance(arg, list) for arg in args):
-            result = []
-            for lst in args:
-                result.extend(lst)
-            return result
+        if entry is not None:
+            arg_types, combine = entry
+            if all(isinstance(arg, arg_types) for arg in args):
+                return combine(args)
         
         # Mixed types - try to convert to strings and concatenate
         return "".join(str(arg) for arg in args)
@@ -320,6 +358,8 @@ class Vector:
     to work with custom objects in intuitive ways.
     """
     
+    __slots__ = ("x", "y")
+    
     def __init__(self, x, y):
         """
         Initialize a Vector object.
@@ -331,6 +371,16 @@ class Vector:
         self.x = x
         self.y = y
     
+    @classmethod
+    def zero(cls):
+        """
+        Create a zero vector, handy as a starting value for += loops.
+        
+        Returns:
+            Vector: New vector with both components set to 0.0
+        """
+        return cls(0.0, 0.0)
+    
     def __add__(self, other):
         """
         Overload + operator for vector addition.
@@ -339,14 +389,15 @@ class Vector:
             other (Vector): Another vector to add
         
         Returns:
-            Vector: New vector with summed components
-        
-        Raises:
-            TypeError: If other is not a Vector
+            Vector: New vector with summed components, or NotImplemented
+            if other has no x/y components (Python then raises TypeError)
         """
-        if not isinstance(other, Vector):
-            raise TypeError("Can only add Vector to Vector")
-        return Vector(self.x + other.x, self.y + other.y)
+        # EAFP ("easier to ask forgiveness than permission"): just use
+        # other.x/other.y instead of checking the type first
+        try:
+            return Vector(self.x + other.x, self.y + other.y)
+        except AttributeError:
+            return NotImplemented
     
     def __sub__(self, other):
         """
@@ -356,11 +407,56 @@ class Vector:
             other (Vector): Another vector to subtract
         
         Returns:
-            Vector: New vector with subtracted components
+            Vector: New vector with subtracted components, or NotImplemented
+            if other has no x/y components (Python then raises TypeError)
         """
-        if not isinstance(other, Vector):
-            raise TypeError("Can only subtract Vector from Vector")
-        return Vector(self.x - other.x, self.y - other.y)
+        try:
+            return Vector(self.x - other.x, self.y - other.y)
+        except AttributeError:
+            return NotImplemented
+    
+    def __iadd__(self, other):
+        """
+        Overload += operator for in-place vector addition.
+        
+        Unlike +, this changes the vector itself instead of creating a
+        new one, so every name referring to this vector sees the change.
+        
+        Args:
+            other (Vector): Another vector to add
+        
+        Returns:
+            Vector: This vector, or NotImplemented if other has no x/y
+            components
+        """
+        try:
+            x, y = self.x + other.x, self.y + other.y
+        except AttributeError:
+            return NotImplemented
+        self.x = x
+        self.y = y
+        return self
+    
+    def __isub__(self, other):
+        """
+        Overload -= operator for in-place vector subtraction.
+        
+        Like +=, this changes the vector itself instead of creating a new one.
+        
+        Args:
+            other (Vector): Another vector to subtract
+        
+        Returns:
+            Vector: This vector, or NotImplemented if other has no x/y
+            components
+        """
+        try:
+            x, y = self.x - other.x, self.y - other.y
+        except AttributeError:
+            return NotImplemented
+        self.x = x
+        self.y = y
+        return self
     
     def __mul__(self, scalar):
         """
@@ -370,11 +466,14 @@ class Vector:
             scalar (float): Scalar value to multiply by
         
         Returns:
-            Vector: New vector with scaled components
+            Vector: New vector with scaled components, or NotImplemented
+            if scalar is not a number (Python then raises TypeError)
         """
+        # The type check stays here: without it, a string "scalar" would
+        # silently repeat text instead of failing
         if isinstance(scalar, (int, float)):
             return Vector(self.x * scalar, self.y * scalar)
-        raise TypeError("Can only multiply Vector by scalar")
+        return NotImplemented
     
     def __rmul__(self, scalar):
         """
@@ -396,11 +495,13 @@ class Vector:
             other (Vector): Another vector to compare
         
         Returns:
-            bool: True if vectors are equal, False otherwise
+            bool: True if vectors are equal, False otherwise, or
+            NotImplemented if other is not a Vector (Python then tries
+            other's __eq__ and finally falls back to an identity check)
         """
-        if not isinstance(other, Vector):
-            return False
-        return self.x == other.x and self.y == other.y
+        if isinstance(other, Vector):
+            return self.x == other.x and self.y == other.y
+        return NotImplemented
     
     def __str__(self):
         """
@@ -427,7 +528,8 @@ class Vector:
         Returns:
             float: Vector magnitude
         """
-        return math.sqrt(self.x ** 2 + self.y ** 2)
+        # math.hypot computes √(x² + y²) in a single C call
+        return math.hypot(self.x, self.y)
     
     def dot_product(self, other):
         """
@@ -448,6 +550,8 @@ class Vector:
 class Duck:
     """Duck class for duck typing demonstration."""
     
+    __slots__ = ()  # No per-instance data
+    
     def make_sound(self):
         """Make duck sound."""
         return "Quack!"
@@ -460,6 +564,8 @@ class Duck:
 class Dog:
     """Dog class for duck typing demonstration."""
     
+    __slots__ = ()  # No per-instance data
+    
     def make_sound(self):
         """Make dog sound."""
         return "Woof!"
@@ -472,6 +578,8 @@ class Dog:
 class Robot:
     """Robot class for duck typing demonstration."""
     
+    __slots__ = ()  # No per-instance data
+    
     def make_sound(self):
         """Make robot sound."""
         return "Beep beep!"
@@ -508,13 +616,9 @@ def animal_actions(animals):
         This function doesn't care about the actual type of objects,
         only that they have the required methods (duck typing).
     """
-    actions = []
-    for animal in animals:
-        # Duck typing: if it walks like a duck and quacks like a duck, it's a duck
-        sound = animal.make_sound()
-        movement = animal.move()
-        actions.append(f"It says '{sound}' and is {movement.lower()}")
-    return actions
+    # Duck typing: if it walks like a duck and quacks like a duck, it's a duck
+    return [f"It says '{animal.make_sound()}' and is {animal.move().lower()}"
+            for animal in animals]
 
 
 def calculate_total_area(shapes):
@@ -531,10 +635,9 @@ def calculate_total_area(shapes):
         This function works with any object that has an area() method,
         regardless of the specific shape type.
     """
-    total = 0
-    for shape in shapes:
-        total += shape.area()  # Polymorphic call - method depends on actual object type
-    return total
+    # Polymorphic call - method depends on actual object type; sum() does
+    # the adding in C instead of a Python-level loop
+    return sum(shape.area() for shape in shapes)
 
 
 def demonstrate_polymorphism():
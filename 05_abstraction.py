@@ -13,10 +13,14 @@ This lesson covers abstraction concepts in OOP:
 Author: AI Senior Engineer
 """
 
-from abc import ABC, abstractmethod, abstractproperty
+from abc import ABC, abstractmethod
 from typing import Protocol, runtime_checkable
 import math
 
+# Currencies every payment processor accepts. A frozenset is built once and
+# gives a hash lookup instead of scanning a new list on every validation.
+_VALID_CURRENCIES = frozenset(("USD", "EUR", "GBP", "JPY"))
+
 
 class Animal(ABC):
     """
@@ -27,8 +31,15 @@ class Animal(ABC):
     - Abstract methods that must be implemented by subclasses
     - Concrete methods that provide common functionality
     - Template method pattern
+    
+    Note:
+        The fixed part of get_status() is built once in __init__, so name,
+        species and age should not be changed after the animal is created.
     """
     
+    # abc.ABC defines empty __slots__, so slots here remove __dict__ entirely
+    __slots__ = ("name", "species", "age", "energy", "hunger")
+    
     def __init__(self, name, species, age):
         """
         Initialize an Animal object.
@@ -99,7 +110,8 @@ class Animal(ABC):
         Returns:
             str: Sleep description
         """
-        self.energy = min(100, self.energy + 30)
+        energy = self.energy + 30
+        self.energy = energy if energy < 100 else 100
         return f"{self.name} is sleeping and recovering energy. Energy: {self.energy}"
     
     def get_hungry(self):
@@ -109,8 +121,10 @@ class Animal(ABC):
         Returns:
             str: Hunger status
         """
-        self.hunger = min(100, self.hunger + 20)
-        self.energy = max(0, self.energy - 10)
+        hunger = self.hunger + 20
+        self.hunger = hunger if hunger < 100 else 100
+        energy = self.energy - 10
+        self.energy = energy if energy > 0 else 0
         return f"{self.name} is getting hungry. Hunger: {self.hunger}, Energy: {self.energy}"
     
     def get_status(self):
@@ -138,14 +152,16 @@ class Animal(ABC):
         Returns:
             str: Description of daily activities
         """
-        activities = []
-        activities.append(f"{self.name} wakes up and {self.make_sound()}")
-        activities.append(f"{self.name} starts {self.move()}")
-        activities.append(self.eat("food"))
-        activities.append(self.move())
-        activities.append(self.sleep())
+        # The steps run in this order; each line already carries its indent
+        activities = [
+            f"  {self.name} wakes up and {self.make_sound()}",
+            f"  {self.name} starts {self.move()}",
+            f"  {self.eat('food')}",
+            f"  {self.move()}",
+            f"  {self.sleep()}",
+        ]
         
-        return "Daily Routine:\n" + "\n".join(f"  {activity}" for activity in activities)
+        return "Daily Routine:\n" + "\n".join(activities)
 
 
 class Dog(Animal):
@@ -158,6 +174,8 @@ class Dog(Animal):
     - Concrete implementation of abstract properties
     """
     
+    __slots__ = ("breed", "loyalty")
+    
     def __init__(self, name, breed, age):
         """
         Initialize a Dog object.
@@ -199,8 +217,10 @@ class Dog(Animal):
         Returns:
             str: Dog's eating behavior
         """
-        self.hunger = max(0, self.hunger - 30)
-        self.energy = min(100, self.energy + 20)
+        hunger = self.hunger - 30
+        self.hunger = hunger if hunger > 0 else 0
+        energy = self.energy + 20
+        self.energy = energy if energy < 100 else 100
         return f"{self.name} is eating {food} enthusiastically"
     
     @property
@@ -234,6 +254,8 @@ class Bird(Animal):
     with bird-specific behaviors.
     """
     
+    __slots__ = ("can_fly", "altitude")
+    
     def __init__(self, name, species, age, can_fly=True):
         """
         Initialize a Bird object.
@@ -280,8 +302,10 @@ class Bird(Animal):
         Returns:
             str: Bird's eating behavior
         """
-        self.hunger = max(0, self.hunger - 25)
-        self.energy = min(100, self.energy + 15)
+        hunger = self.hunger - 25
+        self.hunger = hunger if hunger > 0 else 0
+        energy = self.energy + 15
+        self.energy = energy if energy < 100 else 100
         return f"{self.name} is pecking at {food}"
     
     @property
@@ -333,6 +357,8 @@ class GeometricShape(ABC):
     - Template methods using abstract components
     """
     
+    __slots__ = ("name",)
+    
     def __init__(self, name):
         """
         Initialize a GeometricShape.
@@ -398,10 +424,13 @@ class GeometricShape(ABC):
         Returns:
             str: Complete shape description
         """
+        dimensions = self.dimensions
+        area = self.calculate_area()
+        perimeter = self.calculate_perimeter()
         return (f"Shape: {self.name}\n"
-                f"Dimensions: {self.dimensions}\n"
-                f"Area: {self.calculate_area():.2f}\n"
-                f"Perimeter: {self.calculate_perimeter():.2f}")
+                f"Dimensions: {dimensions}\n"
+                f"Area: {area:.2f}\n"
+                f"Perimeter: {perimeter:.2f}")
 
 
 class Square(GeometricShape):
@@ -409,6 +438,8 @@ class Square(GeometricShape):
     Concrete Square class implementing GeometricShape.
     """
     
+    __slots__ = ("side_length",)
+    
     def __init__(self, side_length):
         """
         Initialize a Square.
@@ -456,7 +487,7 @@ class Square(GeometricShape):
         """
         if self.side_length <= 5:
             size = int(self.side_length)
-            square = "\n".join("* " * size for _ in range(size))
+            square = "\n".join(["* " * size] * size)
             return f"Drawing a {self.name}:\n{square}"
         return f"Drawing a large {self.name} (too big to display)"
 
@@ -466,6 +497,8 @@ class RightTriangle(GeometricShape):
     Concrete RightTriangle class implementing GeometricShape.
     """
     
+    __slots__ = ("base", "height")
+    
     def __init__(self, base, height):
         """
         Initialize a RightTriangle.
@@ -494,8 +527,7 @@ class RightTriangle(GeometricShape):
         Returns:
             float: Perimeter (base + height + hypotenuse)
         """
-        hypotenuse = math.sqrt(self.base ** 2 + self.height ** 2)
-        return self.base + self.height + hypotenuse
+        return self.base + self.height + math.hypot(self.base, self.height)
     
     @property
     def dimensions(self):
@@ -505,11 +537,10 @@ class RightTriangle(GeometricShape):
         Returns:
             dict: Triangle dimensions
         """
-        hypotenuse = math.sqrt(self.base ** 2 + self.height ** 2)
         return {
             "base": self.base,
             "height": self.height,
-            "hypotenuse": hypotenuse
+            "hypotenuse": math.hypot(self.base, self.height)
         }
 
 
@@ -522,6 +553,8 @@ class PaymentProcessor:
     without using ABC, relying on documentation and conventions.
     """
     
+    __slots__ = ()
+    
     def process_payment(self, amount, currency="USD"):
         """
         Process a payment (to be overridden by subclasses).
@@ -549,7 +582,7 @@ class PaymentProcessor:
         Returns:
             bool: True if valid, False otherwise
         """
-        return amount > 0 and currency in ["USD", "EUR", "GBP", "JPY"]
+        return amount > 0 and currency in _VALID_CURRENCIES
 
 
 class CreditCardProcessor(PaymentProcessor):
@@ -557,6 +590,8 @@ class CreditCardProcessor(PaymentProcessor):
     Concrete payment processor for credit cards.
     """
     
+    __slots__ = ("merchant_id",)
+    
     def __init__(self, merchant_id):
         """
         Initialize credit card processor.
@@ -595,6 +630,8 @@ class PayPalProcessor(PaymentProcessor):
     Concrete payment processor for PayPal.
     """
     
+    __slots__ = ("api_key",)
+    
     def __init__(self, api_key):
         """
         Initialize PayPal processor.
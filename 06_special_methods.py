@@ -16,6 +16,7 @@ Author: AI Senior Engineer
 """
 
 import math
+import sys
 from typing import Any, Iterator
 
 
@@ -27,6 +28,14 @@ class Money:
     like built-in types with natural syntax.
     """
     
+    __slots__ = ("amount", "currency")
+    
+    # Supported currencies: the tuple keeps the order for error messages,
+    # the dict validates with a hash lookup and maps each code to one shared
+    # (interned) string, so currency == checks can match by identity
+    _CURRENCIES = ("USD", "EUR", "GBP", "JPY", "CAD")
+    _VALID_CURRENCIES = {code: sys.intern(code) for code in _CURRENCIES}
+    
     def __init__(self, amount, currency="USD"):
         """
         Initialize Money object (__init__ special method).
@@ -41,12 +50,33 @@ class Money:
         if amount < 0:
             raise ValueError("Amount cannot be negative")
         
-        valid_currencies = ["USD", "EUR", "GBP", "JPY", "CAD"]
-        if currency not in valid_currencies:
-            raise ValueError(f"Currency must be one of: {valid_currencies}")
+        canonical_currency = Money._VALID_CURRENCIES.get(currency)
+        if canonical_currency is None:
+            raise ValueError(f"Currency must be one of: {list(Money._CURRENCIES)}")
         
         self.amount = amount
-        self.currency = currency
+        self.currency = canonical_currency
+    
+    @classmethod
+    def _unchecked(cls, amount, currency):
+        """
+        Create a Money object without running __init__'s validation.
+        
+        Only for results of arithmetic on existing Money objects, whose
+        currency is already valid and whose amount was checked by the
+        caller to be non-negative.
+        
+        Args:
+            amount (float): Monetary amount (already known to be >= 0)
+            currency (str): Canonical currency code from a valid Money
+        
+        Returns:
+            Money: New Money object
+        """
+        money = cls.__new__(cls)
+        money.amount = amount
+        money.currency = currency
+        return money
     
     def __str__(self):
         """
@@ -91,7 +121,7 @@ class Money:
         if self.currency != other.currency:
             raise ValueError(f"Cannot add {self.currency} and {other.currency}")
         
-        return Money(self.amount + other.amount, self.currency)
+        return Money._unchecked(self.amount + other.amount, self.currency)
     
     def __sub__(self, other):
         """
@@ -113,7 +143,7 @@ class Money:
         if result_amount < 0:
             raise ValueError("Result would be negative")
         
-        return Money(result_amount, self.currency)
+        return Money._unchecked(result_amount, self.currency)
     
     def __mul__(self, scalar):
         """
@@ -125,13 +155,17 @@ class Money:
         Returns:
             Money: New Money object with multiplied amount
         """
-        if not isinstance(scalar, (int, float)):
+        # Exact int/float are by far the common case and need only two
+        # identity checks; isinstance still accepts subclasses such as bool
+        scalar_type = type(scalar)
+        if (scalar_type is not int and scalar_type is not float
+                and not isinstance(scalar, (int, float))):
             raise TypeError("Can only multiply Money by number")
         
         if scalar < 0:
             raise ValueError("Cannot multiply by negative number")
         
-        return Money(self.amount * scalar, self.currency)
+        return Money._unchecked(self.amount * scalar, self.currency)
     
     def __rmul__(self, scalar):
         """
@@ -157,7 +191,10 @@ class Money:
         Returns:
             Money: New Money object with divided amount
         """
-        if not isinstance(scalar, (int, float)):
+        # Same fast type check as __mul__
+        scalar_type = type(scalar)
+        if (scalar_type is not int and scalar_type is not float
+                and not isinstance(scalar, (int, float))):
             raise TypeError("Can only divide Money by number")
         
         if scalar == 0:
@@ -166,7 +203,7 @@ class Money:
         if scalar < 0:
             raise ValueError("Cannot divide by negative number")
         
-        return Money(self.amount / scalar, self.currency)
+        return Money._unchecked(self.amount / scalar, self.currency)
     
     def __eq__(self, other):
         """
@@ -178,28 +215,47 @@ class Money:
         Returns:
             bool: True if equal, False otherwise
         """
+        # Sets and dicts compare a key with itself often; skip the field checks
+        if other is self:
+            return True
+        
         if not isinstance(other, Money):
             return False
         
-        return (self.amount == other.amount and 
-                self.currency == other.currency)
+        # Currency first: usually decides mismatches with a cheap string check
+        return (self.currency == other.currency and 
+                self.amount == other.amount)
     
-    def __lt__(self, other):
+    def _check_comparable(self, other):
         """
-        Less than comparison (__lt__ special method).
+        Make sure other can be ordered against this Money.
+        
+        Shared by the four ordering operators so they report the same errors.
         
         Args:
-            other (Money): Money object to compare
+            other: Object being compared with self
         
-        Returns:
-            bool: True if self < other
+        Raises:
+            TypeError: If other is not a Money object
+            ValueError: If other uses a different currency
         """
         if not isinstance(other, Money):
             raise TypeError("Can only compare Money with Money")
         
         if self.currency != other.currency:
             raise ValueError(f"Cannot compare {self.currency} with {other.currency}")
+    
+    def __lt__(self, other):
+        """
+        Less than comparison (__lt__ special method).
         
+        Args:
+            other (Money): Money object to compare
+        
+        Returns:
+            bool: True if self < other
+        """
+        self._check_comparable(other)
         return self.amount < other.amount
     
     def __le__(self, other):
@@ -212,7 +268,8 @@ class Money:
         Returns:
             bool: True if self <= other
         """
-        return self < other or self == other
+        self._check_comparable(other)
+        return self.amount <= other.amount
     
     def __gt__(self, other):
         """
@@ -224,7 +281,8 @@ class Money:
         Returns:
             bool: True if self > other
         """
-        return not self <= other
+        self._check_comparable(other)
+        return self.amount > other.amount
     
     def __ge__(self, other):
         """
@@ -236,7 +294,8 @@ class Money:
         Returns:
             bool: True if self >= other
         """
-        return not self < other
+        self._check_comparable(other)
+        return self.amount >= other.amount
     
     def __hash__(self):
         """
@@ -335,7 +394,11 @@ class ShoppingCart:
         Returns:
             bool: True if item is in cart
         """
-        return any(item['name'] == item_name for item in self.items)
+        # A plain loop avoids the generator frame any() would need
+        for item in self.items:
+            if item['name'] == item_name:
+                return True
+        return False
     
     def __iter__(self):
         """
@@ -391,10 +454,15 @@ class ShoppingCart:
         total = sum(item['price'] * item['quantity'] for item in self.items)
         
         # Apply discounts
-        for item_name, discount in self.discounts.items():
-            if item_name in self:
-                item = next(item for item in self.items if item['name'] == item_name)
-                total -= item['price'] * item['quantity'] * discount
+        if self.discounts:
+            # Index items by name once instead of scanning the cart for every
+            # discount. Walking in reverse lets the first item with a given
+            # name win, matching the order of a front-to-back search.
+            items_by_name = {item['name']: item for item in reversed(self.items)}
+            for item_name, discount in self.discounts.items():
+                item = items_by_name.get(item_name)
+                if item is not None:
+                    total -= item['price'] * item['quantity'] * discount
         
         return max(0, total)  # Don't allow negative totals
     
@@ -419,6 +487,9 @@ class Counter:
     and attribute access methods.
     """
     
+    # Public names that __setattr__ refuses to assign
+    _READ_ONLY = frozenset(("step", "history", "current"))
+    
     def __init__(self, initial_value=0, step=1):
         """
         Initialize counter.
@@ -484,19 +555,22 @@ class Counter:
             name (str): Attribute name
             value: Attribute value
         """
-        if name.startswith('_'):
-            # Allow private attributes to be set normally
-            super().__setattr__(name, value)
+        # object.__setattr__ does the actual store; calling it directly also
+        # avoids running this method again for the private names
+        if name[:1] == '_':
+            # Allow private attributes to be set normally (every counter()
+            # call lands here, so this check comes first and stays cheap)
+            object.__setattr__(self, name, value)
         elif name == 'value':
             # Special handling for 'value' attribute
-            self._value = value
+            object.__setattr__(self, '_value', value)
             self._history.append(value)
-        elif name in ['step', 'history', 'current']:
+        elif name in Counter._READ_ONLY:
             # Read-only attributes
             raise AttributeError(f"'{name}' is read-only")
         else:
             # Other attributes set normally
-            super().__setattr__(name, value)
+            object.__setattr__(self, name, value)
     
     def reset(self):
         """Reset counter to initial value."""
@@ -517,6 +591,10 @@ class FileManager:
     'with' statements.
     """
     
+    # Print a message on open/close/error. Set to False (on the class or an
+    # instance) to skip the console output, e.g. when opening many files.
+    verbose = True
+    
     def __init__(self, filename, mode='r'):
         """
         Initialize file manager.
@@ -527,8 +605,7 @@ class FileManager:
         """
         self.filename = filename
         self.mode = mode
-        self.file = None
-        self.opened_successfully = False
+        self.file = None  # Stays None unless __enter__ opens the file
     
     def __enter__(self):
         """
@@ -541,11 +618,12 @@ class FileManager:
         """
         try:
             self.file = open(self.filename, self.mode)
-            self.opened_successfully = True
-            print(f"File '{self.filename}' opened successfully")
+            if self.verbose:
+                print(f"File '{self.filename}' opened successfully")
             return self
         except Exception as e:
-            print(f"Failed to open file '{self.filename}': {e}")
+            if self.verbose:
+                print(f"Failed to open file '{self.filename}': {e}")
             raise
     
     def __exit__(self, exc_type, exc_value, traceback):
@@ -562,12 +640,14 @@ class FileManager:
         Returns:
             bool: True to suppress exception, False to propagate
         """
-        if self.file and self.opened_successfully:
+        if self.file is not None:
             self.file.close()
-            print(f"File '{self.filename}' closed successfully")
+            if self.verbose:
+                print(f"File '{self.filename}' closed successfully")
         
         if exc_type is not None:
-            print(f"Exception occurred: {exc_type.__name__}: {exc_value}")
+            if self.verbose:
+                print(f"Exception occurred: {exc_type.__name__}: {exc_value}")
             return False  # Don't suppress the exception
         
         return True
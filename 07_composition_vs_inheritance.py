@@ -13,9 +13,9 @@ This lesson covers the design decision between composition and inheritance:
 Author: AI Senior Engineer
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Optional
-import math
+import io
+import sys
+from contextlib import redirect_stdout
 
 
 # INHERITANCE APPROACH EXAMPLES
@@ -23,6 +23,9 @@ import math
 class Vehicle:
     """Base vehicle class for inheritance examples."""
     
+    # Subclasses list only the attributes they add
+    __slots__ = ("make", "model", "year", "is_running")
+    
     def __init__(self, make, model, year):
         """Initialize vehicle."""
         self.make = make
@@ -49,6 +52,8 @@ class InheritanceCar(Vehicle):
     A Car IS-A Vehicle
     """
     
+    __slots__ = ("doors", "trunk_open")
+    
     def __init__(self, make, model, year, doors=4):
         """Initialize car using inheritance."""
         super().__init__(make, model, year)
@@ -73,6 +78,8 @@ class InheritanceMotorcycle(Vehicle):
     A Motorcycle IS-A Vehicle
     """
     
+    __slots__ = ("engine_size", "has_helmet")
+    
     def __init__(self, make, model, year, engine_size):
         """Initialize motorcycle using inheritance."""
         super().__init__(make, model, year)
@@ -99,6 +106,8 @@ class Engine:
     into different types of vehicles.
     """
     
+    __slots__ = ("horsepower", "fuel_type", "is_running", "temperature")
+    
     def __init__(self, horsepower, fuel_type="Gasoline"):
         """
         Initialize engine.
@@ -139,6 +148,8 @@ class Wheels:
     Wheels component for composition examples.
     """
     
+    __slots__ = ("count", "size", "wheel_type", "pressure")
+    
     def __init__(self, count, size, wheel_type="Standard"):
         """
         Initialize wheels.
@@ -159,13 +170,16 @@ class Wheels:
     
     def inflate(self, psi):
         """Inflate tires."""
-        self.pressure = min(50, self.pressure + psi)
+        pressure = self.pressure + psi
+        self.pressure = pressure if pressure < 50 else 50  # Max 50 PSI
         return f"Tires inflated to {self.pressure} PSI"
 
 
 class GPS:
     """GPS component that can be added to vehicles."""
     
+    __slots__ = ("current_location", "destination", "is_on")
+    
     def __init__(self):
         """Initialize GPS."""
         self.current_location = "Unknown"
@@ -203,6 +217,9 @@ class CompositionCar:
     from separate, reusable components.
     """
     
+    __slots__ = ("make", "model", "year", "engine", "wheels", "gps", "doors",
+                 "trunk_open")
+    
     def __init__(self, make, model, year, engine, wheels, has_gps=False):
         """
         Initialize car using composition.
@@ -255,16 +272,16 @@ class CompositionCar:
     
     def get_status(self):
         """Get complete car status."""
-        status = [
-            f"Car: {self.year} {self.make} {self.model}",
-            self.engine.get_status(),
-            self.wheels.check_pressure()
-        ]
+        # The first three lines are always there, so build them in one f-string
+        status = (f"Car: {self.year} {self.make} {self.model}\n"
+                  f"{self.engine.get_status()}\n"
+                  f"{self.wheels.check_pressure()}")
         
-        if self.gps and self.gps.is_on:
-            status.append(f"GPS: Active ({self.gps.current_location})")
+        gps = self.gps
+        if gps and gps.is_on:
+            status += f"\nGPS: Active ({gps.current_location})"
         
-        return "\n".join(status)
+        return status
 
 
 class CompositionMotorcycle:
@@ -275,6 +292,9 @@ class CompositionMotorcycle:
     in different vehicle types.
     """
     
+    __slots__ = ("make", "model", "year", "engine", "wheels", "has_helmet",
+                 "sidecar")
+    
     def __init__(self, make, model, year, engine):
         """
         Initialize motorcycle using composition.
@@ -322,6 +342,8 @@ class CompositionMotorcycle:
 class AudioSystem:
     """Audio system component."""
     
+    __slots__ = ("brand", "watts", "volume", "is_on")
+    
     def __init__(self, brand, watts):
         """Initialize audio system."""
         self.brand = brand
@@ -337,7 +359,8 @@ class AudioSystem:
     def set_volume(self, volume):
         """Set volume level."""
         if self.is_on:
-            self.volume = max(0, min(100, volume))
+            # Clamp to 0-100 without calling min()/max()
+            self.volume = 0 if volume < 0 else 100 if volume > 100 else volume
             return f"Volume set to {self.volume}"
         return "Audio system is off"
 
@@ -345,6 +368,8 @@ class AudioSystem:
 class ClimateControl:
     """Climate control component."""
     
+    __slots__ = ("temperature", "is_on", "mode")
+    
     def __init__(self):
         """Initialize climate control."""
         self.temperature = 72
@@ -359,7 +384,8 @@ class ClimateControl:
     def set_temperature(self, temp):
         """Set target temperature."""
         if self.is_on:
-            self.temperature = max(60, min(85, temp))
+            # Clamp to 60-85°F without calling min()/max()
+            self.temperature = 60 if temp < 60 else 85 if temp > 85 else temp
             return f"Temperature set to {self.temperature}°F"
         return "Climate control is off"
 
@@ -372,6 +398,9 @@ class LuxuryCar:
     configuration of features.
     """
     
+    __slots__ = ("make", "model", "year", "engine", "wheels", "gps", "audio",
+                 "climate", "leather_seats", "sunroof")
+    
     def __init__(self, make, model, year, engine_hp=300):
         """Initialize luxury car with premium components."""
         self.make = make
@@ -393,20 +422,21 @@ class LuxuryCar:
     
     def start_luxury_experience(self):
         """Start all luxury systems."""
-        actions = []
-        actions.append(self.engine.start())
-        actions.append(self.gps.turn_on())
-        actions.append(self.audio.turn_on())
-        actions.append(self.climate.turn_on())
-        actions.append("Luxury experience activated")
-        return actions
+        # Elements are evaluated left to right, so systems start in this order
+        return [
+            self.engine.start(),
+            self.gps.turn_on(),
+            self.audio.turn_on(),
+            self.climate.turn_on(),
+            "Luxury experience activated",
+        ]
     
     def set_comfort_settings(self, temp=72, volume=30):
         """Set comfort preferences."""
-        settings = []
-        settings.append(self.climate.set_temperature(temp))
-        settings.append(self.audio.set_volume(volume))
-        return settings
+        return [
+            self.climate.set_temperature(temp),
+            self.audio.set_volume(volume),
+        ]
 
 
 # DEPENDENCY INJECTION EXAMPLE
@@ -419,6 +449,8 @@ class VehicleFactory:
     making the system more flexible and testable.
     """
     
+    __slots__ = ()
+    
     @staticmethod
     def create_economy_car(make, model, year):
         """Create an economy car with basic components."""
@@ -451,6 +483,8 @@ class University:
     independently of the university (aggregation).
     """
     
+    __slots__ = ("name", "students")
+    
     def __init__(self, name):
         """Initialize university."""
         self.name = name
@@ -463,14 +497,19 @@ class University:
     
     def graduate_student(self, student):
         """Graduate a student (remove from university)."""
-        if student in self.students:
+        # remove() already searches the list, so don't scan it twice with "in"
+        try:
             self.students.remove(student)
-            student.university = None
+        except ValueError:
+            return  # Not enrolled here
+        student.university = None
 
 
 class Student:
     """Student that can exist independently."""
     
+    __slots__ = ("name", "age", "university")
+    
     def __init__(self, name, age):
         """Initialize student."""
         self.name = name
@@ -489,18 +528,23 @@ class House:
     
     House HAS Rooms, but rooms cannot exist
     independently of the house (composition).
+    
+    The set of rooms is fixed when the house is built, so rooms is a
+    tuple.
     """
     
+    __slots__ = ("address", "rooms")
+    
     def __init__(self, address):
         """Initialize house."""
         self.address = address
         # Composition - rooms are created with house and destroyed with house
-        self.rooms = [
+        self.rooms = (
             Room("Living Room", 300),
             Room("Kitchen", 150),
             Room("Bedroom", 200),
             Room("Bathroom", 50)
-        ]
+        )
     
     def get_total_area(self):
         """Calculate total house area."""
@@ -514,6 +558,8 @@ class House:
 class Room:
     """Room that exists only as part of a house."""
     
+    __slots__ = ("name", "area")
+    
     def __init__(self, name, area):
         """Initialize room."""
         self.name = name
@@ -679,8 +725,17 @@ def demonstrate_composition_vs_inheritance():
 if __name__ == "__main__":
     """
     Main execution block.
+    
+    The demo output is collected in memory and written to the terminal in
+    one call instead of one write per print(). The write happens in a
+    finally block so a failing demo still shows everything printed so far.
     """
-    demonstrate_composition_vs_inheritance()
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            demonstrate_composition_vs_inheritance()
+    finally:
+        sys.stdout.write(buffer.getvalue())
 
 
 """
@@ -16,10 +16,19 @@ Author: AI Senior Engineer
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Protocol
+from contextlib import redirect_stdout
+from typing import List, Dict, Optional, Protocol, Tuple
 from datetime import datetime
+from itertools import count
 import uuid
 import hashlib
+import hmac
+import io
+import re
+import sys
+
+# Simple email check: something@something.something, without spaces
+_EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
 
 
 # ABSTRACT BASE CLASSES AND INTERFACES
@@ -31,6 +40,8 @@ class Payable(ABC):
     Demonstrates: Abstraction, Abstract methods
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def process_payment(self, amount: float) -> Dict:
         """Process payment and return result."""
@@ -67,6 +78,8 @@ class Address:
     Demonstrates: Composition, Encapsulation
     """
     
+    __slots__ = ("_street", "_city", "_state", "_zip_code", "_country", "_full_address")
+    
     def __init__(self, street: str, city: str, state: str, zip_code: str, country: str = "USA"):
         """Initialize address."""
         self._street = street
@@ -74,6 +87,7 @@ class Address:
         self._state = state
         self._zip_code = zip_code
         self._country = country
+        self._full_address = None
     
     @property
     def street(self) -> str:
@@ -83,7 +97,11 @@ class Address:
     @property
     def full_address(self) -> str:
         """Get formatted full address."""
-        return f"{self._street}, {self._city}, {self._state} {self._zip_code}, {self._country}"
+        # Addresses never change, so the string is built on first use only
+        if self._full_address is None:
+            self._full_address = (f"{self._street}, {self._city}, "
+                                  f"{self._state} {self._zip_code}, {self._country}")
+        return self._full_address
     
     def __str__(self) -> str:
         """String representation."""
@@ -106,18 +124,34 @@ class Money:
     Demonstrates: Special methods, Operator overloading, Encapsulation
     """
     
+    __slots__ = ("_cents", "_currency")
+    
     def __init__(self, amount: float, currency: str = "USD"):
         """Initialize money object."""
         if amount < 0:
             raise ValueError("Amount cannot be negative")
         
-        self._amount = round(amount, 2)
-        self._currency = currency.upper()
+        # Stored as whole cents so arithmetic stays exact
+        self._cents = round(amount * 100)
+        self._currency = sys.intern(currency.upper())
+    
+    @classmethod
+    def _from_cents(cls, cents: int, currency: str) -> "Money":
+        """Build a Money from already validated cents, skipping __init__."""
+        money = cls.__new__(cls)
+        money._cents = cents
+        money._currency = currency
+        return money
     
     @property
     def amount(self) -> float:
         """Get amount."""
-        return self._amount
+        return self._cents / 100
+    
+    @property
+    def cents(self) -> int:
+        """Get amount in whole cents."""
+        return self._cents
     
     @property
     def currency(self) -> str:
@@ -126,11 +160,11 @@ class Money:
     
     def __str__(self) -> str:
         """String representation for users."""
-        return f"${self._amount:.2f} {self._currency}"
+        return f"${self._cents / 100:.2f} {self._currency}"
     
     def __repr__(self) -> str:
         """String representation for developers."""
-        return f"Money({self._amount}, '{self._currency}')"
+        return f"Money({self._cents / 100}, '{self._currency}')"
     
     def __add__(self, other):
         """Add two Money objects."""
@@ -139,7 +173,12 @@ class Money:
         if self._currency != other._currency:
             raise ValueError(f"Cannot add {self._currency} and {other._currency}")
         
-        return Money(self._amount + other._amount, self._currency)
+        # Money is immutable, so adding zero can hand back an operand as is
+        if not other._cents:
+            return self
+        if not self._cents:
+            return other
+        return Money._from_cents(self._cents + other._cents, self._currency)
     
     def __sub__(self, other):
         """Subtract Money objects."""
@@ -148,11 +187,13 @@ class Money:
         if self._currency != other._currency:
             raise ValueError(f"Cannot subtract {other._currency} from {self._currency}")
         
-        result = self._amount - other._amount
+        if not other._cents:
+            return self
+        result = self._cents - other._cents
         if result < 0:
             raise ValueError("Result would be negative")
         
-        return Money(result, self._currency)
+        return Money._from_cents(result, self._currency)
     
     def __mul__(self, scalar):
         """Multiply by scalar."""
@@ -161,7 +202,9 @@ class Money:
         if scalar < 0:
             raise ValueError("Cannot multiply by negative number")
         
-        return Money(self._amount * scalar, self._currency)
+        if scalar == 1:
+            return self
+        return Money._from_cents(round(self._cents * scalar), self._currency)
     
     def __rmul__(self, scalar):
         """Right multiplication."""
@@ -171,32 +214,38 @@ class Money:
         """Check equality."""
         if not isinstance(other, Money):
             return False
-        return self._amount == other._amount and self._currency == other._currency
+        return self._cents == other._cents and self._currency == other._currency
     
-    def __lt__(self, other) -> bool:
-        """Less than comparison."""
+    def _check_comparable(self, other) -> None:
+        """Raise unless other is Money in the same currency."""
         if not isinstance(other, Money):
             raise TypeError("Can only compare Money with Money")
         if self._currency != other._currency:
             raise ValueError(f"Cannot compare {self._currency} with {other._currency}")
-        
-        return self._amount < other._amount
+    
+    def __lt__(self, other) -> bool:
+        """Less than comparison."""
+        self._check_comparable(other)
+        return self._cents < other._cents
     
     def __le__(self, other) -> bool:
         """Less than or equal."""
-        return self < other or self == other
+        self._check_comparable(other)
+        return self._cents <= other._cents
     
     def __gt__(self, other) -> bool:
         """Greater than."""
-        return not self <= other
+        self._check_comparable(other)
+        return self._cents > other._cents
     
     def __ge__(self, other) -> bool:
         """Greater than or equal."""
-        return not self < other
+        self._check_comparable(other)
+        return self._cents >= other._cents
     
     def __hash__(self) -> int:
         """Hash for use in sets/dicts."""
-        return hash((self._amount, self._currency))
+        return hash((self._cents, self._currency))
 
 
 # PRODUCT HIERARCHY WITH INHERITANCE
@@ -208,12 +257,14 @@ class Product(ABC):
     Demonstrates: Abstraction, Inheritance, Encapsulation
     """
     
-    _next_id = 1
+    __slots__ = ("_id", "_name", "_price", "_description", "_in_stock")
+    
+    # Class-level ID generator: 1, 2, 3, ...
+    _ids = count(1)
     
     def __init__(self, name: str, price: Money, description: str = ""):
         """Initialize product."""
-        self._id = Product._next_id
-        Product._next_id += 1
+        self._id = next(Product._ids)
         
         self._name = name
         self._price = price
@@ -291,6 +342,10 @@ class Product(ABC):
         if not isinstance(other, Product):
             return False
         return self._id == other._id
+    
+    def __hash__(self) -> int:
+        """Hash by product ID, consistent with __eq__."""
+        return self._id
 
 
 class Book(Product):
@@ -300,6 +355,8 @@ class Book(Product):
     Demonstrates: Inheritance, Method overriding
     """
     
+    __slots__ = ("_author", "_isbn", "_pages")
+    
     def __init__(self, title: str, author: str, isbn: str, price: Money, pages: int):
         """Initialize book."""
         super().__init__(title, price, f"By {author}")
@@ -342,6 +399,8 @@ class Electronics(Product):
     Demonstrates: Inheritance, Method overriding
     """
     
+    __slots__ = ("_brand", "_model", "_weight", "_warranty_months")
+    
     def __init__(self, name: str, brand: str, model: str, price: Money, 
                  weight: float, warranty_months: int = 12):
         """Initialize electronics."""
@@ -386,6 +445,8 @@ class Clothing(Product):
     Demonstrates: Inheritance, Enumeration handling
     """
     
+    __slots__ = ("_brand", "_size", "_color", "_material")
+    
     SIZES = ["XS", "S", "M", "L", "XL", "XXL"]
     
     def __init__(self, name: str, brand: str, size: str, color: str, 
@@ -428,6 +489,9 @@ class User:
     Demonstrates: Encapsulation, Property decorators, Password hashing
     """
     
+    __slots__ = ("_user_id", "_username", "_email", "_password_hash", "_addresses",
+                 "_created_at", "_is_active")
+    
     def __init__(self, username: str, email: str, password: str):
         """Initialize user."""
         self._user_id = str(uuid.uuid4())
@@ -456,27 +520,32 @@ class User:
     @email.setter
     def email(self, new_email: str):
         """Set new email with validation."""
-        if "@" not in new_email or "." not in new_email.split("@")[1]:
+        if not _EMAIL_PATTERN.fullmatch(new_email):
             raise ValueError("Invalid email format")
         self._email = new_email
     
     @property
-    def addresses(self) -> List[Address]:
+    def addresses(self) -> Tuple[Address, ...]:
         """Get user addresses."""
-        return self._addresses.copy()  # Return copy to prevent modification
+        return tuple(self._addresses)  # Read-only snapshot prevents modification
+    
+    @property
+    def address_count(self) -> int:
+        """Get number of addresses without copying them."""
+        return len(self._addresses)
     
     @property
     def is_active(self) -> bool:
         """Check if user is active."""
         return self._is_active
     
-    def _hash_password(self, password: str) -> str:
+    def _hash_password(self, password: str) -> bytes:
         """Hash password securely."""
-        return hashlib.sha256(password.encode()).hexdigest()
+        return hashlib.sha256(password.encode()).digest()
     
     def verify_password(self, password: str) -> bool:
         """Verify password."""
-        return self._hash_password(password) == self._password_hash
+        return hmac.compare_digest(self._hash_password(password), self._password_hash)
     
     def change_password(self, old_password: str, new_password: str) -> bool:
         """Change password with verification."""
@@ -521,6 +590,8 @@ class CreditCard(Payable):
     Demonstrates: Inheritance from abstract class, Polymorphism
     """
     
+    __slots__ = ("_card_number", "_cardholder_name", "_expiry_month", "_expiry_year", "_cvv")
+    
     def __init__(self, card_number: str, cardholder_name: str, 
                  expiry_month: int, expiry_year: int, cvv: str):
         """Initialize credit card."""
@@ -536,8 +607,9 @@ class CreditCard(Payable):
     
     def validate_payment_info(self) -> bool:
         """Validate credit card information."""
-        current_year = datetime.now().year
-        current_month = datetime.now().month
+        now = datetime.now()
+        current_year = now.year
+        current_month = now.month
         
         # Check expiry date
         if self._expiry_year < current_year:
@@ -579,10 +651,12 @@ class PayPal(Payable):
     Demonstrates: Polymorphism, Different implementation of same interface
     """
     
+    __slots__ = ("_email", "_password_hash", "_is_verified")
+    
     def __init__(self, email: str, password: str):
         """Initialize PayPal account."""
         self._email = email
-        self._password_hash = hashlib.sha256(password.encode()).hexdigest()
+        self._password_hash = hashlib.sha256(password.encode()).digest()
         self._is_verified = True  # Assume account is verified
     
     def validate_payment_info(self) -> bool:
@@ -619,6 +693,8 @@ class CartItem:
     Demonstrates: Composition, Special methods
     """
     
+    __slots__ = ("product", "_quantity", "_total", "_total_price_of")
+    
     def __init__(self, product: Product, quantity: int = 1):
         """Initialize cart item."""
         if quantity <= 0:
@@ -627,12 +703,31 @@ class CartItem:
             raise ValueError("Product is out of stock")
         
         self.product = product
-        self.quantity = quantity
+        self._quantity = quantity
+        self._total = None
+        self._total_price_of = None
+    
+    @property
+    def quantity(self) -> int:
+        """Get quantity."""
+        return self._quantity
+    
+    @quantity.setter
+    def quantity(self, value: int) -> None:
+        """Set quantity and drop the cached total."""
+        self._quantity = value
+        self._total_price_of = None
     
     @property
     def total_price(self) -> Money:
         """Calculate total price for this item."""
-        return self.product.price * self.quantity
+        # Discounts swap in a new price object, so the cache remembers
+        # which price it was computed from
+        price = self.product.price
+        if price is not self._total_price_of:
+            self._total = price * self._quantity
+            self._total_price_of = price
+        return self._total
     
     def __str__(self) -> str:
         """String representation."""
@@ -652,10 +747,14 @@ class ShoppingCart:
     Demonstrates: Container special methods, Composition, Aggregation
     """
     
+    __slots__ = ("_user", "_items", "_index", "_created_at")
+    
     def __init__(self, user: User):
         """Initialize shopping cart."""
         self._user = user
         self._items: List[CartItem] = []
+        # Same items keyed by product for constant-time lookups
+        self._index: Dict[Product, CartItem] = {}
         self._created_at = datetime.now()
     
     @property
@@ -674,11 +773,16 @@ class ShoppingCart:
         if not self._items:
             return Money(0)
         
-        total = self._items[0].total_price
-        for item in self._items[1:]:
-            total = total + item.total_price
+        # Keep a running total in cents and build a single Money at the end
+        currency = self._items[0].total_price.currency
+        cents = 0
+        for item in self._items:
+            item_total = item.total_price
+            if item_total.currency != currency:
+                raise ValueError(f"Cannot add {currency} and {item_total.currency}")
+            cents += item_total.cents
         
-        return total
+        return Money(cents / 100, currency)
     
     def __len__(self) -> int:
         """Get number of unique items."""
@@ -690,7 +794,7 @@ class ShoppingCart:
     
     def __contains__(self, product: Product) -> bool:
         """Check if product is in cart."""
-        return any(item.product == product for item in self._items)
+        return isinstance(product, Product) and product in self._index
     
     def __iter__(self):
         """Make cart iterable."""
@@ -702,17 +806,21 @@ class ShoppingCart:
             raise ValueError(f"{product.name} is out of stock")
         
         # Check if product already in cart
-        for item in self._items:
-            if item.product == product:
-                item.quantity += quantity
-                return
+        item = self._index.get(product)
+        if item is not None:
+            item.quantity += quantity
+            return
         
         # Add new item
-        self._items.append(CartItem(product, quantity))
+        item = CartItem(product, quantity)
+        self._items.append(item)
+        self._index[product] = item
     
     def remove_item(self, product: Product):
         """Remove item from cart."""
-        self._items = [item for item in self._items if item.product != product]
+        item = self._index.pop(product, None)
+        if item is not None:
+            self._items = [other for other in self._items if other is not item]
     
     def update_quantity(self, product: Product, new_quantity: int):
         """Update item quantity."""
@@ -720,28 +828,27 @@ class ShoppingCart:
             self.remove_item(product)
             return
         
-        for item in self._items:
-            if item.product == product:
-                item.quantity = new_quantity
-                return
-        
-        raise ValueError("Product not in cart")
+        item = self._index.get(product)
+        if item is None:
+            raise ValueError("Product not in cart")
+        item.quantity = new_quantity
     
     def clear(self):
         """Clear all items from cart."""
         self._items.clear()
+        self._index.clear()
     
     def apply_discount_to_item(self, product: Product, percentage: float):
         """Apply discount to specific item."""
-        for item in self._items:
-            if item.product == product:
-                if isinstance(item.product, Discountable):
-                    discounted_price = item.product.apply_discount(percentage)
-                    # Create new discounted price
-                    item.product._price = Money(discounted_price, item.product.price.currency)
-                return
+        item = self._index.get(product)
+        if item is None:
+            raise ValueError("Product not in cart")
         
-        raise ValueError("Product not in cart")
+        # Every product satisfies the Discountable protocol, so just call it
+        # (duck typing); a plain Protocol cannot be used with isinstance
+        discounted_price = item.product.apply_discount(percentage)
+        # Create new discounted price
+        item.product._price = Money(discounted_price, item.product.price.currency)
     
     def __str__(self) -> str:
         """String representation."""
@@ -766,6 +873,9 @@ class Order:
     Demonstrates: Composition, Encapsulation, Integration of all concepts
     """
     
+    __slots__ = ("_order_id", "_user", "_items", "_shipping_address", "_created_at",
+                 "_status", "_payment_method", "_transaction_id")
+    
     def __init__(self, user: User, cart: ShoppingCart, shipping_address: Address):
         """Initialize order."""
         if not cart._items:
@@ -793,12 +903,16 @@ class Order:
     @property
     def total_amount(self) -> Money:
         """Calculate total order amount."""
-        subtotal = sum((item.total_price for item in self._items), Money(0))
+        subtotal = self._calculate_subtotal()
         shipping = self._calculate_shipping()
         tax = self._calculate_tax(subtotal)
         
         return subtotal + shipping + tax
     
+    def _calculate_subtotal(self) -> Money:
+        """Calculate the sum of all item totals."""
+        return sum((item.total_price for item in self._items), Money(0))
+    
     def _calculate_shipping(self) -> Money:
         """Calculate shipping cost."""
         total_weight = sum(item.product.get_shipping_weight() * item.quantity 
@@ -870,11 +984,16 @@ class Order:
         for item in self._items:
             lines.append(f"  {item}")
         
+        # Work out each figure once and derive the total from them
+        subtotal = self._calculate_subtotal()
+        shipping = self._calculate_shipping()
+        tax = self._calculate_tax(subtotal)
+        
         lines.extend([
-            f"Subtotal: {sum((item.total_price for item in self._items), Money(0))}",
-            f"Shipping: {self._calculate_shipping()}",
-            f"Tax: {self._calculate_tax(sum((item.total_price for item in self._items), Money(0)))}",
-            f"Total: {self.total_amount}",
+            f"Subtotal: {subtotal}",
+            f"Shipping: {shipping}",
+            f"Tax: {tax}",
+            f"Total: {subtotal + shipping + tax}",
             f"Ship to: {self._shipping_address}"
         ])
         
@@ -919,7 +1038,7 @@ def demonstrate_ecommerce_system():
     
     print(f"Created user: {user}")
     print(f"User ID: {user.user_id}")
-    print(f"Addresses: {len(user.addresses)}")
+    print(f"Addresses: {user.address_count}")
     
     # Test password change
     success = user.change_password("securepass123", "newsecurepass456")
@@ -1029,24 +1148,25 @@ def demonstrate_ecommerce_system():
     print("\n9. OOP CONCEPTS DEMONSTRATED:")
     print("-" * 35)
     
-    concepts = [
-        "✓ Classes and Objects - Product, User, Order, etc.",
-        "✓ Inheritance - Product -> Book/Electronics/Clothing",
-        "✓ Multiple Inheritance - Not used (favor composition)",
-        "✓ Encapsulation - Private attributes with properties",
-        "✓ Polymorphism - Different payment methods, product types",
-        "✓ Abstraction - Abstract Product and Payable classes",
-        "✓ Special Methods - Money class operator overloading",
-        "✓ Composition - Order contains User, Cart, Address",
-        "✓ Aggregation - Cart contains Products (products exist independently)",
-        "✓ Duck Typing - Discountable protocol",
-        "✓ Error Handling - Validation and exceptions",
-        "✓ Property Decorators - User email validation",
-        "✓ Container Behavior - ShoppingCart with __len__, __iter__, etc."
-    ]
-    
-    for concept in concepts:
-        print(f"  {concept}")
+    # A tuple of string literals is a single compile-time constant; the
+    # indent is part of each line so the block prints with one join
+    concepts = (
+        "  ✓ Classes and Objects - Product, User, Order, etc.",
+        "  ✓ Inheritance - Product -> Book/Electronics/Clothing",
+        "  ✓ Multiple Inheritance - Not used (favor composition)",
+        "  ✓ Encapsulation - Private attributes with properties",
+        "  ✓ Polymorphism - Different payment methods, product types",
+        "  ✓ Abstraction - Abstract Product and Payable classes",
+        "  ✓ Special Methods - Money class operator overloading",
+        "  ✓ Composition - Order contains User, Cart, Address",
+        "  ✓ Aggregation - Cart contains Products (products exist independently)",
+        "  ✓ Duck Typing - Discountable protocol",
+        "  ✓ Error Handling - Validation and exceptions",
+        "  ✓ Property Decorators - User email validation",
+        "  ✓ Container Behavior - ShoppingCart with __len__, __iter__, etc."
+    )
+    
+    print("\n".join(concepts))
     
     print(f"\n🎉 Complete E-Commerce System Demonstration Complete!")
     print("This project showcases all major OOP concepts working together")
@@ -1056,8 +1176,18 @@ def demonstrate_ecommerce_system():
 if __name__ == "__main__":
     """
     Main execution block.
+    
+    The demo output is collected in memory and written to the terminal in
+    one call instead of one write per print(). It is written from a
+    finally block, so if a section raises, the earlier sections still show
+    above the traceback.
     """
-    demonstrate_ecommerce_system()
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            demonstrate_ecommerce_system()
+    finally:
+        sys.stdout.write(buffer.getvalue())
 
 
 """
@@ -4,7 +4,13 @@ Explanation: Different types of instance variables in __init__
 This demonstrates why some variables are parameters and others are defaults.
 """
 
+import io
+import sys
+from contextlib import redirect_stdout
+
 class Car:
+    __slots__ = ("make", "model", "year", "color", "is_running", "speed", "mileage")
+    
     def __init__(self, make, model, year, color="Unknown"):
         # TYPE 1: Variables from PARAMETERS (user provides these)
         self.make = make          # User must specify: "Toyota"
@@ -45,6 +51,8 @@ def demonstrate_initialization():
 
 # Alternative design (BAD IDEA - but shows why we don't do this):
 class BadCarExample:
+    __slots__ = ("make", "model", "year", "color", "is_running", "speed", "mileage")
+    
     def __init__(self, make, model, year, color, is_running, speed, mileage):
         # This would be annoying - user has to specify everything!
         self.make = make
@@ -70,10 +78,7 @@ def show_bad_example():
     print("                                               ^^^^^^^^^^^^")
     print("                                               Always False, 0, 0!")
 
-if __name__ == "__main__":
-    demonstrate_initialization()
-    show_bad_example()
-    
+def show_key_takeaway():
     print("\n" + "="*60)
     print("KEY TAKEAWAY:")
     print("="*60)
@@ -84,3 +89,15 @@ if __name__ == "__main__":
     print("   (is_running=False, speed=0, mileage=0)")
     print()
     print("Both are initialized in __init__, but serve different purposes!")
+
+if __name__ == "__main__":
+    # Collect the output in memory and write it to the terminal in one call
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            demonstrate_initialization()
+            show_bad_example()
+            show_key_takeaway()
+    finally:
+        # Written even if a demo raises, so earlier output is not lost
+        sys.stdout.write(buffer.getvalue())